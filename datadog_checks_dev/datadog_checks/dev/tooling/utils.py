@@ -235,20 +235,29 @@ def get_check_files(check_name, file_suffix='.py', abs_file_path=True, include_d
                         yield f
 
 
+def _iter_root_dirs():
+    # `scandir` exposes the cached entry type, so plain files at the root are
+    # skipped without a per-entry `stat` of a path that cannot exist
+    with os.scandir(get_root()) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield entry.name
+
+
 def get_valid_checks():
-    return {path for path in os.listdir(get_root()) if file_exists(get_version_file(path))}
+    return {path for path in _iter_root_dirs() if file_exists(get_version_file(path))}
 
 
 def get_valid_integrations():
-    return {path for path in os.listdir(get_root()) if file_exists(get_manifest_file(path))}
+    return {path for path in _iter_root_dirs() if file_exists(get_manifest_file(path))}
 
 
 def get_testable_checks():
-    return {path for path in os.listdir(get_root()) if file_exists(get_tox_file(path))}
+    return {path for path in _iter_root_dirs() if file_exists(get_tox_file(path))}
 
 
 def get_metric_sources():
-    return {path for path in os.listdir(get_root()) if file_exists(get_metadata_file(path))}
+    return {path for path in _iter_root_dirs() if file_exists(get_metadata_file(path))}
 
 
 def read_metric_data_file(check_name):